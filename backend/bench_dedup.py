@@ -0,0 +1,65 @@
+"""find_possible_duplicates için ölçekleme ölçümü (gerçekçi sentetik kontaklarla).
+
+Kullanım: python bench_dedup.py [en_büyük_satır_sayısı]
+Satır sayısı her adımda ikiye katlanır; satır başına süre sabit kalıyorsa ölçekleme doğrusaldır.
+"""
+from __future__ import annotations
+import random
+import sys
+import time
+from typing import Any, Dict, List
+from dedup import find_possible_duplicates
+
+FIRST_NAMES = [
+    "Ayşe", "Fatma", "Emine", "Hatice", "Zeynep", "Elif", "Merve", "Büşra", "Esra", "Özlem",
+    "Mehmet", "Mustafa", "Ahmet", "Ali", "Hüseyin", "Hasan", "İbrahim", "İsmail", "Osman", "Yusuf",
+    "Murat", "Ömer", "Ramazan", "Halil", "Süleyman", "Abdullah", "Mahmut", "Recep", "Kemal", "Gökhan",
+]
+LAST_NAMES = [
+    "Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Yıldız", "Yıldırım", "Öztürk", "Aydın", "Özdemir",
+    "Arslan", "Doğan", "Kılıç", "Aslan", "Çetin", "Kara", "Koç", "Kurt", "Özkan", "Şimşek",
+    "Polat", "Özcan", "Korkmaz", "Çakır", "Erdoğan", "Yavuz", "Can", "Acar", "Şen", "Aktaş",
+]
+COMPANY_SUFFIXES = ["A.Ş.", "Ltd. Şti.", "Holding", "Teknoloji", "Danışmanlık"]
+
+def _ascii(s: str) -> str:
+    return s.translate(str.maketrans("şŞçÇğĞıİöÖüÜ", "sScCgGiIoOuU")).lower()
+
+def make_contacts(n: int, duplicate_rate: float = 0.02, seed: int = 42) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    companies = [f"Firma{i} {rng.choice(COMPANY_SUFFIXES)}" for i in range(max(10, n // 50))]
+    records = []
+    for i in range(n):
+        if records and rng.random() < duplicate_rate:
+            # Aynı kişi, farklı (yazım hatalı) e-posta ve telefon biçimiyle tekrar girilmiş
+            base = dict(rng.choice(records))
+            local, domain = base["email"].split("@")
+            base["email"] = f"{local[:-1]}@{domain}" if len(local) > 3 else f"x{local}@{domain}"
+            base["first_name"] = base["first_name"].upper()
+            records.append(base)
+            continue
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        records.append({
+            "first_name": first,
+            "last_name": last,
+            "email": f"{_ascii(first)}.{_ascii(last)}{i}@example.com",
+            "phone": f"+90532{rng.randrange(10 ** 7):07d}" if rng.random() < 0.7 else None,
+            "company": rng.choice(companies) if rng.random() < 0.8 else None,
+            "title": None,
+            "notes": None,
+        })
+    return records
+
+def main(max_rows: int) -> None:
+    print(f"{'satır':>10}{'süre s':>10}{'µs/satır':>10}{'küme':>8}")
+    n = 50_000
+    while n <= max_rows:
+        records = make_contacts(n)
+        start = time.perf_counter()
+        clusters = find_possible_duplicates(records)
+        elapsed = time.perf_counter() - start
+        print(f"{n:>10}{elapsed:>10.2f}{elapsed / n * 1e6:>10.1f}{len(clusters):>8}")
+        n *= 2
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 800_000)
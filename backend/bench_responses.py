@@ -0,0 +1,132 @@
+"""/transform, /jobs/{job_id} ve /contacts yanıtları için uçtan uca süre ve aktarılan bayt ölçümü.
+
+Aynı yanıt yolları iki şekilde sunulur: FastAPI'nin varsayılan yolu (response_model ile dict
+döndürmek) ve FastJSONResponse. Her ikisi de main.py'deki ara katman sırasıyla
+(request-id > sıkıştırma) TestClient üzerinden gerçek HTTP istekleriyle ölçülür; bayt
+değerleri yanıtların ağdan okunan (sıkıştırılmış) gövde boyutudur.
+
+Kullanım: python bench_responses.py [satır_sayısı]
+"""
+from __future__ import annotations
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from schemas import TransformResult, ImportJobOut, ContactListOut
+from responses import FastJSONResponse, CompressionMiddleware, brotli
+from settings import settings
+
+ENCODINGS = ["identity", "gzip"] + (["br"] if brotli is not None else [])
+
+def _report(rows: int) -> Dict[str, Any]:
+    report_rows = []
+    for i in range(rows):
+        errors = ["email_format"] if i % 10 == 0 else []
+        report_rows.append({
+            "row": i + 2,
+            "status": "invalid_email" if errors else "ok",
+            "missing": [],
+            "errors": errors,
+        })
+    clusters = [{"status": "possible_duplicate", "rows": [i + 2, i + 3], "score": 0.91} for i in range(0, rows, 100)]
+    return {
+        "rows": report_rows,
+        "summary": {"total": rows, "success": rows - rows // 10, "errors": rows // 10, "possible_duplicates": len(clusters)},
+        "possible_duplicates": clusters,
+    }
+
+def _payloads(rows: int) -> Dict[str, tuple]:
+    report = _report(rows)
+    now = datetime.now()
+    transform = {
+        "total": rows,
+        "success": report["summary"]["success"],
+        "errors": report["summary"]["errors"],
+        "report": report,
+        "export_path": None,
+    }
+    job = {
+        "id": 1,
+        "filename": "contacts.xlsx",
+        "status": "done",
+        "total": rows,
+        "success_count": report["summary"]["success"],
+        "error_count": report["summary"]["errors"],
+        "report": report,
+        "created_at": now,
+    }
+    limit = min(rows, 1000)
+    contacts = {
+        "items": [{
+            "id": i,
+            "first_name": f"Ayşe {i}",
+            "last_name": "Yılmaz",
+            "email": f"ayse.yilmaz{i}@example.com",
+            "phone": f"+90532{i:07d}",
+            "company": "ACME A.Ş.",
+            "title": "Satış Müdürü",
+            "notes": "İstanbul ofisi",
+            "created_at": now,
+        } for i in range(limit)],
+        "count": rows,
+        "offset": 0,
+        "limit": limit,
+    }
+    return {
+        "/transform/{job_id}": (transform, TransformResult),
+        "/jobs/{job_id}": (job, ImportJobOut),
+        "/contacts": (contacts, ContactListOut),
+    }
+
+def _routes(content: Dict[str, Any]) -> tuple:
+    # Yükler kapanış (closure) ile verilir; varsayılan argüman olsaydı FastAPI onu istek parametresi sayardı
+    def default_route():
+        return content
+
+    def fast_route():
+        return FastJSONResponse(content=content)
+    return default_route, fast_route
+
+def _build_app(payloads: Dict[str, tuple]) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MIN_SIZE)
+
+    @app.middleware("http")
+    async def add_request_id(request: Request, call_next):
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = os.urandom(8).hex()
+        return response
+
+    for index, (content, model) in enumerate(payloads.values()):
+        default_route, fast_route = _routes(content)
+        app.add_api_route(f"/default/{index}", default_route, methods=["GET"], response_model=model)
+        app.add_api_route(f"/fast/{index}", fast_route, methods=["GET"], response_model=model)
+    return app
+
+def _measure(client: TestClient, path: str, encoding: str, repeat: int) -> tuple:
+    timings = []
+    wire_bytes = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get(path, headers={"Accept-Encoding": encoding})
+        timings.append(time.perf_counter() - start)
+        wire_bytes = response.num_bytes_downloaded
+    return statistics.median(timings) * 1000, wire_bytes
+
+def main(rows: int, repeat: int = 7) -> None:
+    payloads = _payloads(rows)
+    client = TestClient(_build_app(payloads))
+    print(f"satır: {rows}, tekrar: {repeat} (medyan)")
+    print(f"{'endpoint':<22}{'encoding':>10}{'default ms':>12}{'fast ms':>10}{'default KB':>12}{'fast KB':>10}")
+    for index, endpoint in enumerate(payloads):
+        for encoding in ENCODINGS:
+            default_ms, default_bytes = _measure(client, f"/default/{index}", encoding, repeat)
+            fast_ms, fast_bytes = _measure(client, f"/fast/{index}", encoding, repeat)
+            print(f"{endpoint:<22}{encoding:>10}{default_ms:>12.1f}{fast_ms:>10.1f}{default_bytes / 1024:>12.1f}{fast_bytes / 1024:>10.1f}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
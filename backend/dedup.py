@@ -0,0 +1,220 @@
+from __future__ import annotations
+import gc
+import re
+from collections import defaultdict
+from typing import Dict, List, Any, Optional, Iterable
+
+# Blok içinde her kayıt sıralı komşularından en fazla bu kadarıyla karşılaştırılır.
+# Böylece büyük bloklar (örn. aynı şirketten binlerce kişi) O(n^2) yerine O(n * WINDOW) kalır.
+BLOCK_WINDOW = 8
+SIMILARITY_THRESHOLD = 0.85
+PHONE_SUFFIX_LEN = 7
+
+FIELD_WEIGHTS = {
+    "name": 0.5,
+    "email": 0.2,
+    "phone": 0.2,
+    "company": 0.1,
+}
+
+COMPANY_STOPWORDS = {
+    "ltd", "sti", "as", "a", "s", "anonim", "limited", "sirketi", "ve", "tic", "san",
+    "inc", "llc", "co", "corp", "gmbh", "the",
+}
+
+TR_FOLD = str.maketrans({
+    'ş': 's', 'Ş': 's', 'ç': 'c', 'Ç': 'c', 'ğ': 'g', 'Ğ': 'g',
+    'ı': 'i', 'I': 'i', 'İ': 'i', 'ö': 'o', 'Ö': 'o', 'ü': 'u', 'Ü': 'u',
+    'â': 'a', 'Â': 'a', 'î': 'i', 'Î': 'i', 'û': 'u', 'Û': 'u',
+})
+
+def _clean(value: Any) -> str:
+    # Eşlenmeyen alanlar DataFrame'den NaN (float) olarak gelebilir; boş kabul edilir
+    if value is None or (isinstance(value, float) and value != value):
+        return ""
+    s = str(value).strip()
+    return "" if s == "nan" else s
+
+def fold_tr(value: Any) -> str:
+    s = _clean(value)
+    if not s:
+        return ""
+    s = s.translate(TR_FOLD).lower()
+    return re.sub(r"[^a-z0-9 ]", " ", s).strip()
+
+def _compact(value: str) -> str:
+    return value.replace(" ", "")
+
+def _bigrams(value: str, gram_ids: Dict[str, int]) -> int:
+    """Karakter ikililerinin çoklu kümesini tek bir tam sayı bit maskesi olarak döndürür.
+
+    Tekrar eden ikililer sayaçla ayrıştırılır ("a98" ile "a9898" aynı kümeye düşmez). Her
+    (ikili, tekrar) çiftine paylaşılan bir bit atanır; kayıt başına küçük nesneler yerine tek
+    bir int tutulduğu için bellek ve GC yükü satır sayısıyla doğrusal kalır.
+    """
+    if not value:
+        return 0
+    padded = f"^{value}$"
+    counts: Dict[str, int] = {}
+    mask = 0
+    for i in range(len(padded) - 1):
+        gram = padded[i:i + 2]
+        counts[gram] = counts.get(gram, 0) + 1
+        key = f"{gram}{counts[gram]}"
+        bit = gram_ids.get(key)
+        if bit is None:
+            bit = gram_ids[key] = len(gram_ids)
+        mask |= 1 << bit
+    return mask
+
+def _company_token(company: str) -> str:
+    for token in company.split():
+        if token not in COMPANY_STOPWORDS and len(token) > 1:
+            return token
+    return ""
+
+def _prepare(record: Dict[str, Any], gram_ids: Dict[str, int], gram_cache: Dict[str, int]) -> Dict[str, Any]:
+    first = fold_tr(record.get("first_name"))
+    last = fold_tr(record.get("last_name"))
+    email = _clean(record.get("email")).lower()
+    phone = re.sub(r"\D", "", _clean(record.get("phone")))
+    company = fold_tr(record.get("company"))
+    name = _compact(f"{first}{last}")
+    local = email.split("@", 1)[0]
+
+    def grams(value: str) -> int:
+        # Ad ve şirket değerleri çok tekrar eder; aynı değer bir kez hesaplanır
+        cached = gram_cache.get(value)
+        if cached is None:
+            cached = gram_cache[value] = _bigrams(value, gram_ids)
+        return cached
+
+    return {
+        "first": _compact(first),
+        "last": _compact(last),
+        "name": name,
+        "phone": phone,
+        "company_token": _company_token(company),
+        # Benzerlik skoru için karakter ikilileri önceden hesaplanır (Dice katsayısı)
+        "name_grams": grams(name),
+        "email_grams": _bigrams(local, gram_ids),
+        "company_grams": grams(_compact(company)),
+    }
+
+def blocking_keys(prepared: Dict[str, Any]) -> List[str]:
+    keys = []
+    if prepared["first"] and prepared["last"]:
+        keys.append(f"n:{prepared['first'][:3]}:{prepared['last'][:3]}")
+    if len(prepared["phone"]) >= PHONE_SUFFIX_LEN:
+        keys.append(f"p:{prepared['phone'][-PHONE_SUFFIX_LEN:]}")
+    if prepared["company_token"] and prepared["name"]:
+        keys.append(f"c:{prepared['company_token']}:{prepared['name'][:1]}")
+    return keys
+
+def _dice(a: int, b: int) -> float:
+    return 2.0 * (a & b).bit_count() / (a.bit_count() + b.bit_count())
+
+def _field_score(a: Dict[str, Any], b: Dict[str, Any], field: str) -> Optional[float]:
+    if field == "phone":
+        if not a["phone"] or not b["phone"]:
+            return None
+        return 1.0 if a["phone"][-PHONE_SUFFIX_LEN:] == b["phone"][-PHONE_SUFFIX_LEN:] else 0.0
+    ga, gb = a[f"{field}_grams"], b[f"{field}_grams"]
+    if not ga or not gb:
+        return None
+    return _dice(ga, gb)
+
+def similarity(a: Dict[str, Any], b: Dict[str, Any], threshold: float = SIMILARITY_THRESHOLD) -> float:
+    score = 0.0
+    weight = 0.0
+    remaining = sum(FIELD_WEIGHTS.values())
+    for field in ("name", "phone", "company"):
+        w = FIELD_WEIGHTS[field]
+        remaining -= w
+        s = _field_score(a, b, field)
+        if s is None:
+            continue
+        score += w * s
+        weight += w
+        # Kalan alanlar (e-posta dahil) tam eşleşse bile eşiğe ulaşılamıyorsa erken çık
+        if (score + remaining) / (weight + remaining) < threshold:
+            return 0.0
+    # Farklı e-posta tekrarın tipik nedeni olduğu için e-posta yalnızca skoru yükseltiyorsa sayılır
+    s = _field_score(a, b, "email")
+    if s is not None and (weight == 0 or s > score / weight):
+        score += FIELD_WEIGHTS["email"] * s
+        weight += FIELD_WEIGHTS["email"]
+    # Yalnızca tek bir alan üzerinden eşleşme (örn. ortak santral numarası) yeterli sayılmaz
+    if weight <= max(FIELD_WEIGHTS.values()):
+        return 0.0
+    return score / weight
+
+def _find(parent: List[int], i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+def find_possible_duplicates(
+    records: List[Dict[str, Any]],
+    row_numbers: Optional[Iterable[int]] = None,
+    threshold: float = SIMILARITY_THRESHOLD,
+) -> List[Dict[str, Any]]:
+    """Bloklama + blok içi benzerlik skoru ile olası tekrar eden kontak kümelerini bulur.
+
+    Her kayıt birkaç bloklama anahtarına (Türkçe katlanmış ad önekleri, telefonun son hanesi,
+    şirket kelimesi) düşer; karşılaştırma yalnızca aynı blok içinde ve sıralı komşular
+    arasında yapıldığı için toplam maliyet kayıt sayısıyla yaklaşık doğrusal büyür.
+    """
+    rows = list(row_numbers) if row_numbers is not None else list(range(len(records)))
+    # Milyonlarca küçük nesne oluşturulurken döngüsel GC taramaları süreyi doğrusal olmaktan
+    # çıkarıyor; bu yapılar döngü içermediği için hazırlık süresince GC duraklatılır
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        gram_ids: Dict[str, int] = {}
+        gram_cache: Dict[str, int] = {}
+        prepared = [_prepare(r, gram_ids, gram_cache) for r in records]
+        return _cluster(prepared, rows, threshold)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+def _cluster(prepared: List[Dict[str, Any]], rows: List[int], threshold: float) -> List[Dict[str, Any]]:
+
+    blocks: Dict[str, List[int]] = defaultdict(list)
+    for i, p in enumerate(prepared):
+        for key in blocking_keys(p):
+            blocks[key].append(i)
+
+    parent = list(range(len(prepared)))
+    best_score: Dict[int, float] = {}
+    for members in blocks.values():
+        if len(members) < 2:
+            continue
+        members.sort(key=lambda i: prepared[i]["name"])
+        for pos, i in enumerate(members):
+            for j in members[pos + 1:pos + 1 + BLOCK_WINDOW]:
+                ri, rj = _find(parent, i), _find(parent, j)
+                if ri == rj:
+                    continue
+                score = similarity(prepared[i], prepared[j], threshold)
+                if score >= threshold:
+                    parent[rj] = ri
+                    best_score[ri] = max(score, best_score.get(ri, 0.0), best_score.pop(rj, 0.0))
+
+    clusters: Dict[int, List[int]] = defaultdict(list)
+    for i in range(len(prepared)):
+        clusters[_find(parent, i)].append(i)
+
+    result = []
+    for root, members in clusters.items():
+        if len(members) < 2:
+            continue
+        result.append({
+            "status": "possible_duplicate",
+            "rows": sorted(rows[i] for i in members),
+            "score": round(best_score.get(root, 0.0), 3),
+        })
+    result.sort(key=lambda c: c["rows"][0])
+    return result
@@ -0,0 +1,139 @@
+from __future__ import annotations
+import math
+import random
+from statistics import NormalDist
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+from utils import validate_row, STANDARD_FIELDS, STANDARD_FIELDS_BY_TYPE
+
+ERROR_TYPES = ["email_format", "phone_format", "missing_required", "duplicate_email"]
+DEFAULT_CONFIDENCE = 0.95
+DEFAULT_MARGIN = 0.03
+MAX_EXAMPLES = 5
+# Örneklem hiçbir zaman bundan büyük tutulmaz; aksi halde dry-run tüm dosyayı belleğe alabilir
+MAX_SAMPLE_SIZE = 100_000
+
+def required_sample_size(confidence: float = DEFAULT_CONFIDENCE, margin: float = DEFAULT_MARGIN) -> int:
+    """En kötü durum (p=0.5) için oran tahmininde istenen hata payını sağlayan örneklem büyüklüğü."""
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    return min(MAX_SAMPLE_SIZE, math.ceil(z * z * 0.25 / (margin * margin)))
+
+def wilson_interval(k: int, n: int, population: int, confidence: float = DEFAULT_CONFIDENCE) -> Tuple[float, float]:
+    if n == 0:
+        return 0.0, 1.0
+    p = k / n
+    if n >= population:
+        # Tüm satırlar doğrulandı; tahmin kesin
+        return p, p
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    z2 = z * z
+    center = (p + z2 / (2 * n)) / (1 + z2 / n)
+    half = z * math.sqrt(p * (1 - p) / n + z2 / (4 * n * n)) / (1 + z2 / n)
+    # Sonlu kitle düzeltmesi: örneklem kitlenin önemli bir kısmıysa aralık daralır
+    if population > 1:
+        half *= math.sqrt((population - n) / (population - 1))
+    return max(0.0, center - half), min(1.0, center + half)
+
+def _clean(value: Any) -> str:
+    s = str(value).strip() if value is not None else ""
+    return "" if s == "nan" else s
+
+def reservoir_sample(
+    rows: Iterable[Dict[str, str]],
+    size: int,
+    email_column: Optional[str] = None,
+    seed: Optional[int] = None,
+) -> Tuple[List[Tuple[int, Dict[str, str], bool]], int]:
+    """Dosya akış halinde okunurken sabit boyutlu rastgele örneklem (Algorithm R) toplar.
+
+    E-posta tekrarları yalnızca örnekleme bakarak doğru ölçülemeyeceği için, her satırın
+    daha önce görülmüş bir e-postayı tekrar edip etmediği akış sırasında işaretlenir.
+    """
+    rng = random.Random(seed)
+    seen_emails = set()
+    sample: List[Tuple[int, Dict[str, str], bool]] = []
+    total = 0
+    for total, row in enumerate(rows, start=1):
+        duplicate = False
+        if email_column is not None:
+            email = _clean(row.get(email_column))
+            if email:
+                duplicate = email in seen_emails
+                seen_emails.add(email)
+        # Excel'de başlık 1. satır olduğu için veri satırları 2'den başlar
+        entry = (total + 1, row, duplicate)
+        if len(sample) < size:
+            sample.append(entry)
+        else:
+            j = rng.randrange(total)
+            if j < size:
+                sample[j] = entry
+    return sample, total
+
+def dry_run(
+    rows: Iterable[Dict[str, str]],
+    mapping: Dict[str, str],
+    import_type: str = "contact",
+    confidence: float = DEFAULT_CONFIDENCE,
+    margin: float = DEFAULT_MARGIN,
+    seed: Optional[int] = None,
+) -> Dict[str, Any]:
+    std_fields = STANDARD_FIELDS_BY_TYPE.get(import_type, STANDARD_FIELDS)
+    email_column = None
+    for excel_col, std_field in mapping.items():
+        if std_field == "email":
+            email_column = excel_col
+
+    size = required_sample_size(confidence, margin)
+    sample, total = reservoir_sample(rows, size, email_column if import_type == "contact" else None, seed)
+    sample.sort(key=lambda entry: entry[0])
+
+    counts = {error_type: 0 for error_type in ERROR_TYPES}
+    examples: Dict[str, List[Dict[str, Any]]] = {error_type: [] for error_type in ERROR_TYPES}
+    for row_number, row, duplicate in sample:
+        item = {field: "" for field in std_fields}
+        for excel_col, std_field in mapping.items():
+            if excel_col in row:
+                item[std_field] = _clean(row[excel_col])
+        values = dict(item)
+        # Tekrar bilgisi akış sırasında hesaplandı; validate_row'a tek elemanlı küme ile aktarılır
+        seen_emails = {item.get("email")} if duplicate else set()
+        status, missing_required, errors = validate_row(item, import_type, seen_emails)
+
+        found = list(errors)
+        if missing_required:
+            found.append("missing_required")
+        for error_type in found:
+            if error_type not in counts:
+                continue
+            counts[error_type] += 1
+            if len(examples[error_type]) < MAX_EXAMPLES:
+                examples[error_type].append({
+                    "row": row_number,
+                    "status": status,
+                    "missing": missing_required,
+                    "errors": errors,
+                    "values": values,
+                })
+
+    n = len(sample)
+    estimates = {}
+    for error_type, k in counts.items():
+        lower, upper = wilson_interval(k, n, total, confidence)
+        rate = k / n if n else 0.0
+        estimates[error_type] = {
+            "count": k,
+            "rate": round(rate, 4),
+            "lower": round(lower, 4),
+            "upper": round(upper, 4),
+            "estimated_rows": round(rate * total),
+        }
+
+    return {
+        "total": total,
+        "sample_size": n,
+        "confidence": confidence,
+        "margin": margin,
+        "exact": n >= total,
+        "estimates": estimates,
+        "examples": examples,
+    }
@@ -6,9 +6,11 @@ from fastapi.responses import JSONResponse, FileResponse
 from sqlalchemy.orm import Session
 from database import Base, engine, get_db
 from models import Template, ImportJob, Contact
-from schemas import TemplateCreate, TemplateOut, PreviewOut, TransformRequest, TransformResult, ImportJobOut
+from schemas import TemplateCreate, TemplateOut, PreviewOut, TransformRequest, TransformResult, ImportJobOut, DryRunRequest, DryRunResult, ContactListOut
 from crud import create_template as crud_create_template, get_template_by_name, list_templates, create_job, update_job, bulk_insert_contacts, get_job
-from utils import save_upload, preview_excel, suggest_mapping, apply_mapping, export_json, export_csv, UPLOAD_DIR, EXPORT_DIR, _read_dataframe, STANDARD_FIELDS, STANDARD_FIELDS_BY_TYPE
+from utils import save_upload, preview_excel, suggest_mapping, apply_mapping, export_json, export_csv, UPLOAD_DIR, EXPORT_DIR, _read_dataframe, iter_rows, STANDARD_FIELDS, STANDARD_FIELDS_BY_TYPE
+from dry_run import dry_run
+from responses import FastJSONResponse, CompressionMiddleware
 import pandas as pd
 from fastapi.concurrency import run_in_threadpool
 from pathlib import Path
@@ -17,6 +19,10 @@ from settings import settings
 
 app = FastAPI(title=settings.APP_NAME, version=settings.APP_VERSION)
 
+# Büyük JSON yanıtları (rapor, kontak listesi) için br/gzip sıkıştırma.
+# add_request_id'den önce eklenir ki onun içinde kalsın ve yanıt gövdesini tek parça görsün
+app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MIN_SIZE)
+
 @app.middleware("http")
 async def add_request_id(request: Request, call_next):
     request_id = request.headers.get("X-Request-ID") or os.urandom(8).hex()
@@ -47,6 +53,7 @@ def root():
             "/upload",
             "/templates [GET, POST]",
             "/transform/{job_id}",
+            "/dry-run/{job_id}",
             "/jobs/{job_id}",
             "/contacts",
             "/exports/{filename}",
@@ -189,18 +196,61 @@ async def transform_data(
             error_count=errors,
             report=report
         )
-        return TransformResult(
-            total=total,
-            success=success,
-            errors=errors,
-            report=report,
-            export_path=export_path
-        )
+        # Rapor bizim ürettiğimiz veri; TransformResult ile yeniden doğrulamaya gerek yok
+        return FastJSONResponse(content={
+            "total": total,
+            "success": success,
+            "errors": errors,
+            "report": report,
+            "export_path": export_path,
+        })
     
     except Exception as e:
         update_job(db, job, status="failed")
         raise HTTPException(status_code=500, detail=f"İşlem sırasında bir hata oluştu: {e}")
 
+@app.post("/dry-run/{job_id}", response_model=DryRunResult, tags=["import"])
+async def dry_run_endpoint(
+    job_id: int,
+    body: DryRunRequest,
+    db: Session = Depends(get_db)
+):
+    job = get_job(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job bulunamadı.")
+
+    file_path = UPLOAD_DIR / job.filename
+    if not file_path.exists():
+        raise HTTPException(status_code=404, detail="Yüklenen dosya bulunamadı.")
+
+    try:
+        mapping = body.mapping
+        if body.template_name:
+            tpl = get_template_by_name(db, body.template_name)
+            if not tpl:
+                raise HTTPException(status_code=404, detail="Şablon bulunamadı.")
+            mapping = tpl.column_map
+
+        _, columns, rows = await run_in_threadpool(iter_rows, str(file_path), body.sheet)
+        try:
+            if not mapping:
+                mapping = await run_in_threadpool(suggest_mapping, columns)
+                if not mapping:
+                    raise HTTPException(status_code=400, detail="Eşleştirme verilmedi ve otomatik tahmin yapılamadı. Lütfen bir şablon veya eşleştirme sağlayın.")
+
+            # Job durumu değiştirilmez; dry-run yalnızca tahmini hata oranlarını döner
+            result = await run_in_threadpool(
+                dry_run, rows, mapping, body.import_type, body.confidence, body.margin, body.seed
+            )
+        finally:
+            rows.close()
+        return DryRunResult(**result)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Dry-run sırasında bir hata oluştu: {e}")
+
 @app.get("/exports/{filename}", tags=["export"])
 def download_export(filename: str):
     safe_name = Path(filename).name
@@ -216,9 +266,18 @@ def get_job_status(job_id: int, db: Session = Depends(get_db)):
     job = get_job(db, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job bulunamadı.")
-    return job
+    return FastJSONResponse(content={
+        "id": job.id,
+        "filename": job.filename,
+        "status": job.status,
+        "total": job.total,
+        "success_count": job.success_count,
+        "error_count": job.error_count,
+        "report": job.report,
+        "created_at": job.created_at,
+    })
 
-@app.get("/contacts", tags=["contacts"])
+@app.get("/contacts", response_model=ContactListOut, tags=["contacts"])
 def list_contacts(
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
@@ -259,4 +318,4 @@ def list_contacts(
         "notes": c.notes,
         "created_at": c.created_at,
     } for c in rows]
-    return {"items": items, "count": total, "offset": offset, "limit": limit}
\ No newline at end of file
+    return FastJSONResponse(content={"items": items, "count": total, "offset": offset, "limit": limit})
\ No newline at end of file
@@ -0,0 +1,191 @@
+from __future__ import annotations
+import json
+import zlib
+from datetime import date, datetime
+from typing import Any, Optional
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import orjson
+except ImportError:  # orjson yoksa standart json ile devam edilir
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # brotli yoksa yalnızca gzip sunulur
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+class FastJSONResponse(JSONResponse):
+    """Güvenilir iç veriyi Pydantic doğrulaması ve jsonable_encoder'dan geçirmeden serileştirir.
+
+    Endpoint bu sınıfı doğrudan döndürdüğünde FastAPI response_model doğrulamasını atlar;
+    response_model yalnızca OpenAPI dokümantasyonu için kalır.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+def select_encoding(accept_encoding: str) -> Optional[str]:
+    qualities = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        qualities[token] = q
+
+    wildcard = qualities.get("*", 0.0)
+    br = qualities.get("br", wildcard) if brotli is not None else 0.0
+    gzip = qualities.get("gzip", wildcard)
+    if br > 0 and br >= gzip:
+        return "br"
+    if gzip > 0:
+        return "gzip"
+    return None
+
+class _Compressor:
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int) -> None:
+        if encoding == "br":
+            self._obj = brotli.Compressor(quality=brotli_quality)
+            self.process = self._obj.process
+            self.finish = self._obj.finish
+        else:
+            self._obj = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self.process = self._obj.compress
+            self.finish = self._obj.flush
+
+def compress(body: bytes, encoding: str, gzip_level: int = 6, brotli_quality: int = 4) -> bytes:
+    compressor = _Compressor(encoding, gzip_level, brotli_quality)
+    return compressor.process(body) + compressor.finish()
+
+class CompressionMiddleware:
+    """Accept-Encoding'e göre br/gzip sıkıştırma; eşik altındaki yanıtlar olduğu gibi gönderilir."""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(send, encoding, self.minimum_size, self.gzip_level, self.brotli_quality)
+        await self.app(scope, receive, responder.send)
+
+class _CompressionResponder:
+    def __init__(self, send: Send, encoding: str, minimum_size: int, gzip_level: int, brotli_quality: int) -> None:
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.buffer = bytearray()
+        self.passthrough = False
+
+    def _compressible(self, headers: MutableHeaders) -> bool:
+        if "content-encoding" in headers:
+            return False
+        if self.start_message["status"] in (204, 206, 304):
+            return False
+        # Content-Range sıkıştırılmamış gövdeyi tarif eder; kısmi yanıtlar olduğu gibi gönderilir
+        if "content-range" in headers:
+            return False
+        return headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+
+    def _mark_encoded(self, headers: MutableHeaders) -> None:
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        # Bayt aralıkları sıkıştırılmamış gövdeye göre sunulur; sıkıştırılmış yanıtta aralık desteği ilan edilmez
+        del headers["Accept-Ranges"]
+        # Gövde bayt olarak değiştiği için güçlü ETag zayıf ETag'e çevrilir
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self.start_message = message
+            return
+        if message_type != "http.response.body" or self.passthrough:
+            await self._flush_start()
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is not None:
+            chunk = self.compressor.process(body)
+            if not more_body:
+                chunk += self.compressor.finish()
+            await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+            return
+
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        if not self._compressible(headers):
+            self.passthrough = True
+            await self._flush_start()
+            await self._send(message)
+            return
+
+        # Parçalı gelen yanıtlar eşiğe ulaşana kadar biriktirilir; küçük yanıtlar sıkıştırılmaz
+        self.buffer += body
+        if more_body and len(self.buffer) < self.minimum_size:
+            return
+        body, self.buffer = bytes(self.buffer), bytearray()
+
+        if not more_body:
+            if len(body) < self.minimum_size:
+                self.passthrough = True
+                await self._flush_start()
+                await self._send({"type": "http.response.body", "body": body, "more_body": False})
+                return
+            # Tüm gövde elde: tek seferde sıkıştırılır ve Content-Length güncellenir
+            compressed = compress(body, self.encoding, self.gzip_level, self.brotli_quality)
+            self._mark_encoded(headers)
+            headers["Content-Length"] = str(len(compressed))
+            await self._flush_start()
+            await self._send({"type": "http.response.body", "body": compressed, "more_body": False})
+            return
+
+        # Akış halinde yanıt (örn. FileResponse): uzunluk önceden bilinemez
+        self._mark_encoded(headers)
+        del headers["Content-Length"]
+        self.compressor = _Compressor(self.encoding, self.gzip_level, self.brotli_quality)
+        await self._flush_start()
+        await self._send({"type": "http.response.body", "body": self.compressor.process(body), "more_body": True})
+
+    async def _flush_start(self) -> None:
+        if self.start_message is not None:
+            message, self.start_message = self.start_message, None
+            await self._send(message)
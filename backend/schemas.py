@@ -58,4 +58,46 @@ class ImportJobOut(BaseModel):
     created_at: datetime
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class ContactOut(BaseModel):
+    id:int
+    first_name:Optional[str]=None
+    last_name:Optional[str]=None
+    email:Optional[str]=None
+    phone:Optional[str]=None
+    company:Optional[str]=None
+    title:Optional[str]=None
+    notes:Optional[str]=None
+    created_at: datetime
+
+class ContactListOut(BaseModel):
+    items: List[ContactOut]
+    count: int
+    offset: int
+    limit: int
+
+class DryRunRequest(BaseModel):
+    template_name:Optional[str] = None
+    mapping:Optional[Dict[str, str]] =None
+    sheet:Optional[str] = None
+    import_type: Literal["contact", "ticket", "organization"] = "contact"
+    confidence: float = Field(0.95, gt=0, le=0.999)
+    margin: float = Field(0.03, ge=0.005, lt=0.5, description="Hata oranı tahmini için istenen hata payı")
+    seed: Optional[int] = None
+
+class ErrorEstimate(BaseModel):
+    count: int
+    rate: float
+    lower: float
+    upper: float
+    estimated_rows: int
+
+class DryRunResult(BaseModel):
+    total: int
+    sample_size: int
+    confidence: float
+    margin: float
+    exact: bool
+    estimates: Dict[str, ErrorEstimate]
+    examples: Dict[str, List[Dict[str, Any]]]
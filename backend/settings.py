@@ -6,6 +6,7 @@ class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite:///./grispi.db"
     CORS_ORIGINS: str = ""
     MAX_UPLOAD_MB: int = 10
+    COMPRESSION_MIN_SIZE: int = 1024
     APP_NAME: str = "Grispi Contacts Importer"
     APP_VERSION: str = "1.1.0"
     ENV: str = "development"
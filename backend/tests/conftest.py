@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Backend modülleri paket değil, düz modüller (main.py, utils.py, ...) olarak içe aktarılıyor
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
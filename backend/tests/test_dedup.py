@@ -0,0 +1,88 @@
+import pandas as pd
+
+from dedup import (
+    _bigrams,
+    _prepare,
+    blocking_keys,
+    find_possible_duplicates,
+    fold_tr,
+    similarity,
+)
+from utils import apply_mapping
+
+NAN = float("nan")
+
+# Bit maskeleri yalnızca aynı ikili-kimlik tablosuyla hazırlanan kayıtlar arasında karşılaştırılabilir
+GRAM_IDS = {}
+
+def prepared(**record):
+    return _prepare(record, GRAM_IDS, {})
+
+def test_fold_tr_turkish_and_missing_values():
+    assert fold_tr("İsmail IŞIK") == "ismail isik"
+    assert fold_tr("Ayşe Yılmaz-Öz") == "ayse yilmaz oz"
+    assert fold_tr(None) == ""
+    assert fold_tr(NAN) == ""
+
+def test_blocking_keys():
+    p = prepared(first_name="Ayşe", last_name="Yılmaz", phone="+905321234567", company="ACME A.Ş.")
+    assert blocking_keys(p) == ["n:ays:yil", "p:1234567", "c:acme:a"]
+
+def test_blocking_keys_ignore_nan_fields():
+    p = prepared(first_name="Ali", last_name="Kaya", email="ali@x.com", phone=NAN, company=NAN)
+    assert blocking_keys(p) == ["n:ali:kay"]
+
+def test_repeated_bigrams_are_counted():
+    ids = {}
+    a, b = _bigrams("a98b98", ids), _bigrams("a9898b9898", ids)
+    assert a != b
+    assert (a & b).bit_count() < b.bit_count()
+
+def test_similarity_early_exit_on_different_names():
+    a = prepared(first_name="Ali", last_name="Kaya", phone="+905321234567", email="ali@x.com")
+    b = prepared(first_name="Zeynep", last_name="Öztürk", phone="+905321234567", email="ali@x.com")
+    assert similarity(a, b) == 0.0
+
+def test_similarity_name_only_is_not_enough():
+    a = prepared(first_name="Ali", last_name="Kaya", email="ali.kaya@x.com")
+    b = prepared(first_name="Ali", last_name="Kaya", email="veli@y.com")
+    assert similarity(a, b) == 0.0
+
+def test_different_email_does_not_hide_same_name_same_phone():
+    records = [
+        {"first_name": "İsmail", "last_name": "Işık", "phone": "+905321112233", "email": "ismail@a.com"},
+        {"first_name": "Ismail", "last_name": "Isik", "phone": "05321112233", "email": "i.isik@b.com"},
+    ]
+    assert find_possible_duplicates(records, [2, 3]) == [
+        {"status": "possible_duplicate", "rows": [2, 3], "score": 1.0}
+    ]
+
+def test_nan_company_does_not_create_a_match():
+    records = [
+        {"first_name": "Ali", "last_name": "Kaya", "email": "ali.kaya@x.com", "phone": NAN, "company": NAN},
+        {"first_name": "Ali", "last_name": "Kaya", "email": "", "phone": NAN, "company": NAN},
+    ]
+    assert find_possible_duplicates(records) == []
+
+def test_clusters_are_transitive():
+    records = [
+        {"first_name": "Ayşe", "last_name": "Yılmaz", "email": "ayse.yilmaz@acme.com", "company": "ACME A.Ş."},
+        {"first_name": "AYSE", "last_name": "YILMAZ", "email": "ayse.yilmz@acme.com", "company": "Acme"},
+        {"first_name": "Ayse", "last_name": "Yilmaz", "phone": "0532 123 45 67", "company": "Acme"},
+        {"first_name": "Mehmet", "last_name": "Demir", "email": "m@x.com", "company": "Foo"},
+    ]
+    clusters = find_possible_duplicates(records, [10, 11, 12, 13])
+    assert [c["rows"] for c in clusters] == [[10, 11, 12]]
+
+def test_apply_mapping_reports_possible_duplicates():
+    df = pd.DataFrame({
+        "Ad": ["Ayşe", "AYSE", "Mehmet"],
+        "Soyad": ["Yılmaz", "YILMAZ", "Demir"],
+        "Mail": ["ayse.yilmaz@acme.com", "ayse.yilmz@acme.com", "m@x.com"],
+        "Firma": ["ACME", "Acme", "Foo"],
+    })
+    mapping = {"Ad": "first_name", "Soyad": "last_name", "Mail": "email", "Firma": "company"}
+    records, report = apply_mapping(df, mapping)
+    assert len(records) == 3
+    assert report["summary"]["possible_duplicates"] == 1
+    assert report["possible_duplicates"][0]["rows"] == [2, 3]
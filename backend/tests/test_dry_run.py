@@ -0,0 +1,95 @@
+import pytest
+from openpyxl import Workbook
+from pydantic import ValidationError
+
+from dry_run import MAX_SAMPLE_SIZE, dry_run, required_sample_size, reservoir_sample, wilson_interval
+from schemas import DryRunRequest
+from utils import _read_dataframe, apply_mapping, iter_rows
+
+MAPPING = {"Ad": "first_name", "Mail": "email", "Tel": "phone"}
+
+def test_required_sample_size():
+    assert required_sample_size(0.95, 0.03) == 1068
+    assert required_sample_size(0.95, 1e-6) == MAX_SAMPLE_SIZE
+
+def test_dry_run_request_rejects_tiny_margin():
+    with pytest.raises(ValidationError):
+        DryRunRequest(margin=1e-6)
+
+def test_wilson_interval_exact_when_everything_sampled():
+    assert wilson_interval(3, 10, 10) == (0.3, 0.3)
+    assert wilson_interval(0, 0, 10) == (0.0, 1.0)
+
+def test_wilson_interval_finite_population_correction():
+    lower, upper = wilson_interval(10, 100, 10 ** 9)
+    assert lower < 0.1 < upper
+    small_lower, small_upper = wilson_interval(10, 100, 200)
+    assert lower < small_lower and small_upper < upper
+
+def test_reservoir_sample_flags_duplicates_of_unsampled_rows():
+    rows = [{"Mail": "a@x.com"}, {"Mail": "b@x.com"}, {"Mail": "a@x.com"}, {"Mail": ""}, {"Mail": "b@x.com"}]
+    sample, total = reservoir_sample(rows, size=10, email_column="Mail")
+    assert total == 5
+    assert [(row, duplicate) for row, _, duplicate in sample] == [
+        (2, False), (3, False), (4, True), (5, False), (6, True),
+    ]
+
+    sample, total = reservoir_sample(rows * 100, size=7, email_column="Mail", seed=1)
+    assert total == 500 and len(sample) == 7
+    # İlk 5 satırdan sonra her e-posta daha önce görülmüş sayılır
+    assert all(duplicate for row, values, duplicate in sample if row > 6 and values["Mail"])
+
+def _transform_report(path):
+    df, _, _ = _read_dataframe(str(path), None)
+    _, report = apply_mapping(df, MAPPING)
+    return report
+
+def _dry_run(path):
+    _, _, rows = iter_rows(str(path), None)
+    return dry_run(rows, MAPPING)
+
+def _assert_parity(path):
+    report = _transform_report(path)
+    result = _dry_run(path)
+    assert result["exact"]
+    assert result["total"] == report["summary"]["total"]
+    for error_type, estimate in result["estimates"].items():
+        expected_rows = [
+            r["row"] for r in report["rows"]
+            if error_type in r["errors"] or (error_type == "missing_required" and r["missing"])
+        ]
+        assert estimate["count"] == len(expected_rows), error_type
+        assert [e["row"] for e in result["examples"][error_type]] == expected_rows[:5], error_type
+
+def test_parity_with_transform_on_csv_with_blank_rows(tmp_path):
+    path = tmp_path / "contacts.csv"
+    path.write_text(
+        "﻿Ad,Mail,Tel\n"
+        "Ali,ali@x.com,05321234567\n"
+        "\n"
+        ",,\n"
+        "Veli,bad,1\n"
+        "Can,ali@x.com,\n"
+        "\n",
+        encoding="utf-8",
+    )
+    _assert_parity(path)
+    assert _dry_run(path)["estimates"]["missing_required"]["count"] == 1
+
+def test_parity_with_transform_on_xlsx_with_blank_rows(tmp_path):
+    path = tmp_path / "contacts.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Ad", "Mail", "Tel"])
+    ws.append(["Ali", "ali@x.com", 5321234567])
+    ws.append([None, None, None])
+    ws.append(["Veli", "bad", 5321234568.0])
+    ws.append(["Can", "ali@x.com", None])
+    ws.append([None, None, None])
+    ws.append([None, None, None])
+    wb.save(path)
+    _assert_parity(path)
+    result = _dry_run(path)
+    assert result["total"] == 4
+    assert [e["row"] for e in result["examples"]["missing_required"]] == [3]
+    assert [e["row"] for e in result["examples"]["duplicate_email"]] == [5]
@@ -1,12 +1,15 @@
 from __future__ import annotations
 import re
 from pathlib import Path
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, List, Tuple, Any, Optional, Iterator
 import pandas as pd
 import json
+import csv
 from datetime import datetime
 from werkzeug.utils import secure_filename
+from openpyxl import load_workbook
 import os
+from dedup import find_possible_duplicates
 
 DATA_DIR = Path("data")
 UPLOAD_DIR = DATA_DIR / "uploads"
@@ -114,6 +117,78 @@ def _read_dataframe(filepath: str, sheet_name: Optional[str]) -> tuple[pd.DataFr
     else:
         raise ValueError("Unsupported file type. Only .xlsx, .xls, .csv are supported.")
 
+def _excel_str(value: Any) -> str:
+    # pandas'ın openpyxl okuyucusu gibi tam sayı değerli float'lar int'e çevrilir (5321234567.0 -> "5321234567")
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+def _primed(gen: Iterator) -> Iterator:
+    # Üreteç ilk yield'e kadar ilerletilir; böylece hiç tüketilmeden close() çağrılsa da
+    # with/finally blokları çalışır ve dosya/çalışma kitabı kapanır
+    next(gen)
+    return gen
+
+def iter_rows(filepath: str, sheet_name: Optional[str]) -> Tuple[str, List[str], Iterator[Dict[str, str]]]:
+    """Dosyayı tamamen belleğe almadan satır satır okur (CSV ve .xlsx için akış halinde).
+
+    Dönen üreteç tüketilmeyecekse çağıran taraf close() ile kaynağı serbest bırakmalıdır.
+    """
+    path = Path(filepath)
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        # utf-8-sig: BOM ilk başlığa karışmasın (pandas ile aynı sütun adları)
+        f = open(filepath, newline="", encoding="utf-8-sig")
+        reader = csv.reader(f)
+        columns = [str(c) for c in next(reader, [])]
+
+        def csv_rows() -> Iterator[Dict[str, str]]:
+            with f:
+                yield None
+                for values in reader:
+                    # pd.read_csv yalnızca tamamen boş satırları atlar; ",,," satırları veri sayılır
+                    if not values:
+                        continue
+                    yield dict(zip(columns, values))
+        return "CSV", columns, _primed(csv_rows())
+    elif suffix == ".xlsx":
+        wb = load_workbook(filepath, read_only=True, data_only=True)
+        sheets = wb.sheetnames
+        used_sheet = sheet_name if (sheet_name and sheet_name in sheets) else (sheets[0] if sheets else None)
+        if used_sheet is None:
+            wb.close()
+            return "", [], (row for row in ())
+        rows = wb[used_sheet].iter_rows(values_only=True)
+        columns = [str(c) if c is not None else "" for c in next(rows, ())]
+
+        def xlsx_rows() -> Iterator[Dict[str, str]]:
+            try:
+                yield None
+                # pd.read_excel aradaki boş satırları korur, yalnızca sondakileri atar; bu yüzden
+                # boş satırlar bir sonraki dolu satır gelene kadar bekletilir
+                pending: List[Dict[str, str]] = []
+                for values in rows:
+                    row = {col: _excel_str(v) for col, v in zip(columns, values)}
+                    if all(v is None for v in values):
+                        pending.append(row)
+                        continue
+                    yield from pending
+                    pending.clear()
+                    yield row
+            finally:
+                wb.close()
+        return used_sheet, columns, _primed(xlsx_rows())
+    elif suffix == ".xls":
+        # openpyxl .xls okuyamaz; pandas üzerinden okunup satırlar üretilir
+        df, used_sheet, _ = _read_dataframe(filepath, sheet_name)
+        df = df.fillna('')
+        columns = [str(c) for c in df.columns.tolist()]
+        return used_sheet, columns, (dict(zip(columns, values)) for values in df.itertuples(index=False, name=None))
+    else:
+        raise ValueError("Unsupported file type. Only .xlsx, .xls, .csv are supported.")
+
 def preview_excel(filepath: str, sheet_name: Optional[str] = None) -> Tuple[str, List[str], List[str], List[Dict[str, Any]]]:
     df, used_sheet, sheets = _read_dataframe(filepath, sheet_name)
     if used_sheet == "":
@@ -185,8 +260,42 @@ def suggest_mapping(columns: List[str]) -> Dict[str, str]:
 
     return mapping
 
+def validate_row(item: Any, import_type: str, seen_emails: set) -> Tuple[str, List[str], List[str]]:
+    status = "ok"
+    missing_required = []
+    errors = []
+
+    if import_type == "contact":
+        email_val = item.get("email")
+        phone_val = item.get("phone")
+        # En az bir iletişim alanı zorunlu: email veya telefon
+        if not email_val and not phone_val:
+            status = "missing_required"
+            missing_required.append("email_or_phone")
+        elif email_val and not EMAIL_REGEX.match(str(email_val)):
+            status = "invalid_email"
+            errors.append("email_format")
+
+    if item.get("phone"):
+        norm_phone = normalize_phone(item["phone"])
+        if not PHONE_REGEX.match(norm_phone or ""):
+            errors.append("phone_format")
+            item["phone"] = None
+        else:
+            item["phone"] = norm_phone
+
+    if import_type == "contact":
+        if item.get("email") and item["email"] in seen_emails:
+            status = "duplicate"
+            errors.append("duplicate_email")
+        else:
+            if item.get("email"):
+                seen_emails.add(item["email"])
+    return status, missing_required, errors
+
 def apply_mapping(df: pd.DataFrame, mapping: Dict[str, str], import_type: str = "contact") -> Tuple[list, Dict]:
     records = []
+    record_rows = []
     report = {"rows": [], "summary": {}}
     seen_emails = set()
 
@@ -196,39 +305,14 @@ def apply_mapping(df: pd.DataFrame, mapping: Dict[str, str], import_type: str =
         if excel_col in df.columns:
             mapped_df[std_field] = df[excel_col].astype(str)
             mapped_df[std_field] = mapped_df[std_field].replace('nan', '').str.strip()
+    # Eşlenmeyen alanlar NaN kalırsa validate_row bunları dolu sayar; dry-run ile aynı şekilde "" yapılır
+    mapped_fields = {std_field for excel_col, std_field in mapping.items() if excel_col in df.columns}
+    unmapped = [f for f in std_fields if f not in mapped_fields]
+    mapped_df = mapped_df.fillna('')
 
     for idx, item in mapped_df.iterrows():
-        status = "ok"
-        missing_required = []
-        errors = []
-
-        if import_type == "contact":
-            email_val = item.get("email")
-            phone_val = item.get("phone")
-            # En az bir iletişim alanı zorunlu: email veya telefon
-            if not email_val and not phone_val:
-                status = "missing_required"
-                missing_required.append("email_or_phone")
-            elif email_val and not EMAIL_REGEX.match(str(email_val)):
-                status = "invalid_email"
-                errors.append("email_format")
-
-        if item.get("phone"):
-            norm_phone = normalize_phone(item["phone"])
-            if not PHONE_REGEX.match(norm_phone or ""):
-                errors.append("phone_format")
-                item["phone"] = None
-            else:
-                item["phone"] = norm_phone
-
-        if import_type == "contact":
-            if item.get("email") and item["email"] in seen_emails:
-                status = "duplicate"
-                errors.append("duplicate_email")
-            else:
-                if item.get("email"):
-                    seen_emails.add(item["email"])
-        
+        status, missing_required, errors = validate_row(item, import_type, seen_emails)
+
         report["rows"].append({
             "row": int(idx) + 2,
             "status": status,
@@ -237,7 +321,12 @@ def apply_mapping(df: pd.DataFrame, mapping: Dict[str, str], import_type: str =
         })
 
         if status == "ok":
-            records.append(item.to_dict())
+            record = item.to_dict()
+            # Kayıtta eşlenmeyen alanlar NULL olarak kalır (unique email/phone için "" yazılmaz)
+            for field in unmapped:
+                record[field] = None
+            records.append(record)
+            record_rows.append(int(idx) + 2)
 
     total = len(df)
     report["summary"] = {
@@ -245,6 +334,12 @@ def apply_mapping(df: pd.DataFrame, mapping: Dict[str, str], import_type: str =
         "success": len(records),
         "errors": total - len(records),
     }
+
+    # E-postası farklı ama aynı kişi olması muhtemel kayıtlar; import'u engellemez, yalnızca raporlanır
+    if import_type == "contact":
+        clusters = find_possible_duplicates(records, record_rows)
+        report["possible_duplicates"] = clusters
+        report["summary"]["possible_duplicates"] = len(clusters)
     return records, report
 
 def export_json(records: list[dict]) -> str: